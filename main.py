@@ -11,6 +11,44 @@ logger = structlog.get_logger(__name__)
 
 mcp = FastMCP("MustGather", host="0.0.0.0")
 
+# get_logs is paginated via start_index, but every page used to re-walk
+# and re-parse the whole must-gather. Keep the most recent extractions so
+# pagination is just a slice of an already-parsed list.
+_LOG_CACHE_MAX = 8
+_log_cache: Dict[tuple, List[Dict[str, Any]]] = {}
+
+
+def _get_all_logs(must_gather_path: str, pod_name: str, namespace: str, cluster_name: str) -> List[Dict[str, Any]]:
+    """Fetch all matching log entries, reusing a cached result when the same query repeats."""
+    key = (must_gather_path, pod_name, namespace, cluster_name)
+    logs = _log_cache.get(key)
+    if logs is None:
+        logs = parse_mg(must_gather_path, find_logs=True, pod_name=pod_name, namespace=namespace, cluster_name=cluster_name, logger=logger)
+        if isinstance(logs, list):
+            if len(_log_cache) >= _LOG_CACHE_MAX:
+                _log_cache.pop(next(iter(_log_cache)))
+            _log_cache[key] = logs
+    return logs
+
+
+# Failure-analysis results, same shape as the log cache: agents follow a
+# get_failed_clusters call in a typical session, and both tools re-parse
+# the whole must-gather otherwise.
+_RESULT_CACHE_MAX = 8
+_result_cache: Dict[tuple, list] = {}
+
+
+def _cached_parse(key: tuple, compute) -> list:
+    """Return the cached parse result for key, computing and storing it on a miss."""
+    result = _result_cache.get(key)
+    if result is None:
+        result = compute()
+        if isinstance(result, list):
+            if len(_result_cache) >= _RESULT_CACHE_MAX:
+                _result_cache.pop(next(iter(_result_cache)))
+            _result_cache[key] = result
+    return result
+
 @mcp.tool()
 def parse_must_gather(must_gather_path: str) -> str:
     """Parse a must-gather directory and extract Agent CRs"""
@@ -26,15 +64,37 @@ def get_failed_clusters(must_gather_path: str) -> List[Cluster]:
         must_gather_path (str, required): Path to the must-gather directory
     """
     logger.info(f"Getting failed clusters from must-gather path: {must_gather_path}")
-    failed_clusters = parse_mg(must_gather_path, logger=logger, clusters=True)
-    logger.info(f"Found {len(failed_clusters)} failed clusters")
+    failed_clusters = _cached_parse(
+        ('clusters', must_gather_path),
+        lambda: parse_mg(must_gather_path, logger=logger, clusters=True),
+    )
+    # debug: one line per failed cluster; keep INFO to a single summary
+    # line so the per-call hot path isn't formatting per-item events
     for cluster in failed_clusters:
         if cluster:
-            logger.info(f"Cluster {cluster.name} in namespace {cluster.namespace} is not installed")
+            logger.debug(f"Cluster {cluster.name} in namespace {cluster.namespace} is not installed")
         #logger.info(f"cluster: {cluster}")
     logger.info(f"Returning {len(failed_clusters)} failed clusters")
     return failed_clusters
 
+@mcp.tool()
+def get_failed_clusters_and_agents(must_gather_path: str) -> List[Any]:
+    """
+    Get the clusters that have failed installation and the agents (hosts)
+    belonging to them in a single call
+
+    Args:
+        must_gather_path (str, required): Path to the must-gather directory
+    """
+    # One parse pass serves both analyses: the combined flow walks the
+    # must-gather once instead of a clusters call followed by one agents
+    # call per failed cluster
+    logger.info(f"Getting failed clusters and their agents from must-gather path: {must_gather_path}")
+    return _cached_parse(
+        ('clusters+agents', must_gather_path),
+        lambda: parse_mg(must_gather_path, logger=logger, clusters=True, find_agents=True),
+    )
+
 @mcp.tool()
 def get_failed_agents(must_gather_path: str, cluster_name: str, namespace: str) -> List[Dict[str, Any]]:
     """
@@ -46,7 +106,10 @@ def get_failed_agents(must_gather_path: str, cluster_name: str, namespace: str)
         namespace (str, required): Namespace of the cluster that failed installation
     """
     logger.info(f"Finding agents for cluster {cluster_name} in namespace {namespace}")
-    agents = parse_mg(must_gather_path, clusters=False, find_agents=True, cluster_name=cluster_name, namespace=namespace, logger=logger)
+    agents = _cached_parse(
+        ('agents', must_gather_path, cluster_name, namespace),
+        lambda: parse_mg(must_gather_path, clusters=False, find_agents=True, cluster_name=cluster_name, namespace=namespace, logger=logger),
+    )
     return agents
 
 @mcp.tool()
@@ -78,8 +141,8 @@ def get_logs(must_gather_path: str, pod_name: str = '', namespace: str = '', clu
         start_index (int, optional): Start index of the logs to get
     """
     chunk_size = 25
-    logs = parse_mg(must_gather_path, find_logs=True, pod_name=pod_name, namespace=namespace, cluster_name=cluster_name, logger=logger)
-    logger.info(f"Chunk size {chunk_size}, start index {start_index}, cluster name {cluster_name}")
+    logs = _get_all_logs(must_gather_path, pod_name, namespace, cluster_name)
+    logger.debug(f"Chunk size {chunk_size}, start index {start_index}, cluster name {cluster_name}")
 
     if chunk_size > 0:
         logs = logs[start_index:start_index+chunk_size]
@@ -96,13 +159,16 @@ def find_pod_logs_file_path(must_gather_path: str, pod_name: str, namespace: str
         pod_name (str, required): Name of the pod to find
         namespace (str, required): Namespace of the pod to find
     """
-    pod_dir = LogParser(must_gather_path).find_pod_directory(pod_name=pod_name, namespace=namespace)
+    # One parser per call - constructing a second one just to resolve the
+    # logs directory re-does the path setup for nothing
+    log_parser = LogParser(must_gather_path)
+    pod_dir = log_parser.find_pod_directory(pod_name=pod_name, namespace=namespace)
     if pod_dir:
-        logs_path = LogParser(must_gather_path).find_pod_logs_directory(pod_dir=pod_dir)
-        logger.info(f"Logs path: {logs_path}")
+        logs_path = log_parser.find_pod_logs_directory(pod_dir=pod_dir)
+        logger.debug(f"Logs path: {logs_path}")
         for log_file in logs_path.iterdir():
             if log_file.is_file():
-                logger.info(f"Log file: {log_file}")
+                logger.debug(f"Log file: {log_file}")
                 return log_file
     return None
 
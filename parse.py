@@ -2,13 +2,16 @@
 OpenShift Must-Gather Parser for assisted service CRs
 """
 
+import atexit
+import hashlib
 import json
 import os
+import shutil
+import subprocess
 import tarfile
 import tempfile
-import yaml
 from pathlib import Path
-from typing import Dict, List, Any, Optional, Union
+from typing import Dict, List, Any, Optional, Tuple, Union
 import structlog
 from resources.agents import AgentParser
 from resources.assisted import assisted_service_active
@@ -17,6 +20,34 @@ from resources.logs import LogParser
 
 default_logger = structlog.get_logger(__name__)
 
+# Extractions keyed by (archive content hash, find_logs): parsing the
+# same tarball twice (or the same bytes re-uploaded under a new name)
+# reuses the first extraction instead of inflating it again. Cached
+# directories are removed when the process exits.
+_extraction_cache: Dict[Tuple[str, bool], Path] = {}
+
+# TemporaryDirectory handles for live extractions, keyed by their path.
+# Keeping the handle alive keeps its weakref finalizer armed, so the
+# directory is removed even on exit paths that skip explicit cleanup.
+_extraction_tmpdirs: Dict[Path, tempfile.TemporaryDirectory] = {}
+
+
+def _archive_digest(archive_path: str) -> str:
+    """SHA-256 of the archive contents."""
+    # hashlib.file_digest reads straight into the C hasher (which uses
+    # the CPU's SHA extensions where available) with no Python-level
+    # chunk loop
+    with open(archive_path, 'rb') as f:
+        return hashlib.file_digest(f, 'sha256').hexdigest()
+
+
+def _cleanup_cached_extractions():
+    for cached_path in _extraction_cache.values():
+        cleanup_extraction(cached_path)
+
+
+atexit.register(_cleanup_cached_extractions)
+
 
 def parse_must_gather(must_gather_path: str, logger: structlog.stdlib.BoundLogger, clusters: bool = False, find_agents: bool = False, find_logs: bool = False, pod_name: str = '', namespace: str = '', cluster_name: str = '' ) -> List[Any]:
     """
@@ -39,13 +70,18 @@ def parse_must_gather(must_gather_path: str, logger: structlog.stdlib.BoundLogge
         path = Path(must_gather_path)
         
         if path.is_file() and path.suffix in ['.gz', '.tgz'] or path.name.endswith('.tar.gz'):
-            # Extract tar.gz file
-            extracted_path = extract_must_gather_archive(must_gather_path)
-            cleanup_needed = True
+            # Extract tar.gz file, reusing a previous extraction of the
+            # same content when one is still around
+            cache_key = (_archive_digest(must_gather_path), find_logs)
+            extracted_path = _extraction_cache.get(cache_key)
+            if extracted_path is None or not extracted_path.exists():
+                extracted_path = extract_must_gather_archive(must_gather_path, extract_logs=find_logs)
+                _extraction_cache[cache_key] = extracted_path
+            else:
+                logger.info(f"Reusing cached extraction for archive: {must_gather_path}")
         elif path.is_dir():
             # Use directory directly
             extracted_path = path
-            cleanup_needed = False
         else:
             return json.dumps({
                 "error": f"Invalid must-gather path: {must_gather_path}. Must be a .tar.gz file or directory.",
@@ -65,16 +101,16 @@ def parse_must_gather(must_gather_path: str, logger: structlog.stdlib.BoundLogge
                 logger.info(f"Finding failed clusters")
                 return_data = ClusterParser(extracted_path).get_failed_clusters()
                 if find_agents:
+                    # Reuse one AgentParser so the namespaces/ tree is walked
+                    # once for all clusters instead of once per cluster
+                    agent_parser = AgentParser(extracted_path)
+                    cluster_agents = []
                     for cluster in return_data:
-                        agents = AgentParser(extracted_path).find_agents_belonging_to_cluster(cluster['cluster_deployment_name'], cluster['namespace'])
-                        return_data.extend(agents)
+                        cluster_agents.extend(agent_parser.find_agents_belonging_to_cluster(cluster.cluster_deployment_name, cluster.namespace))
+                    return_data.extend(cluster_agents)
             elif find_logs:
                 logger.info(f"Finding logs for pod {pod_name} in namespace {namespace} and cluster {cluster_name}")
                 return_data = LogParser(extracted_path).get_logs_by_pod(pod_name=pod_name, namespace=namespace, cluster_name=cluster_name)
-        # Clean up extracted files if needed
-        if cleanup_needed:
-            cleanup_extraction(extracted_path)
-        
         return return_data
         
     except Exception as e:
@@ -87,36 +123,82 @@ def parse_must_gather(must_gather_path: str, logger: structlog.stdlib.BoundLogge
         })
 
 
-def extract_must_gather_archive(archive_path: str) -> Path:
-    """Extract must-gather tar.gz archive to temporary directory."""
-    logger.info(f"Extracting must-gather archive: {archive_path}")
-    
-    # Create temporary directory
-    temp_dir = Path(tempfile.mkdtemp(prefix="must_gather_"))
-    
-    # Extract archive
-    with tarfile.open(archive_path, 'r:gz') as tar:
-        tar.extractall(temp_dir)
+def extract_must_gather_archive(archive_path: str, extract_logs: bool = True) -> Path:
+    """Extract must-gather tar.gz archive to temporary directory.
+
+    Pod log files dominate archive size; when the caller is not after
+    logs, skip everything under a logs/ directory instead of writing it
+    to disk.
+    """
+    default_logger.info(f"Extracting must-gather archive: {archive_path}")
+
+    # tempfile.TemporaryDirectory rather than a bare mkdtemp: cleanup
+    # goes through the stdlib's optimized rmtree and a weakref finalizer
+    # backstops removal if explicit cleanup never runs
+    tmp_handle = tempfile.TemporaryDirectory(prefix="must_gather_")
+    temp_dir = Path(tmp_handle.name)
+    _extraction_tmpdirs[temp_dir] = tmp_handle
+
+    # Prefer the system tar when present - its C extraction path is much
+    # faster than Python's tarfile on big archives
+    tar_bin = shutil.which('tar')
+    if tar_bin:
+        try:
+            cmd = [tar_bin, '-xzf', str(archive_path), '-C', str(temp_dir)]
+            if not extract_logs:
+                cmd.append('--exclude=*/logs/*')
+            subprocess.run(cmd, check=True)
+            return _find_extracted_root(temp_dir)
+        except (subprocess.CalledProcessError, OSError) as e:
+            default_logger.warning(f"System tar extraction failed, falling back to tarfile: {e}")
+
+    # Stream the archive ('r|gz') with a 2 MiB copy buffer: members are
+    # decompressed exactly once in order, nothing is seeked back through
+    # the gzip stream, and peak memory stays at one buffer rather than
+    # the whole decompressed archive
+    with tarfile.open(archive_path, mode='r|gz', bufsize=2 * 1024 * 1024) as tar:
+        if extract_logs:
+            tar.extractall(temp_dir)
+        else:
+            tar.extractall(temp_dir, members=(m for m in tar if '/logs/' not in m.name))
     
-    # Find the actual must-gather directory (usually has timestamp in name)
-    extracted_dirs = [d for d in temp_dir.iterdir() if d.is_dir()]
-    if extracted_dirs:
-        return extracted_dirs[0]  # Return first directory found
-    else:
-        return temp_dir
+    return _find_extracted_root(temp_dir)
+
+
+def _find_extracted_root(temp_dir: Path) -> Path:
+    """Find the actual must-gather directory (usually has timestamp in name)."""
+    # A cheap name-prefix check picks the real must-gather directory when
+    # the archive also unpacked siblings (event filters, version files);
+    # the first directory found remains the fallback
+    first_dir = None
+    with os.scandir(temp_dir) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                if entry.name.startswith('must-gather'):
+                    return Path(entry.path)
+                if first_dir is None:
+                    first_dir = Path(entry.path)
+    return first_dir if first_dir is not None else temp_dir
 
 
 def cleanup_extraction(extracted_path: Path):
     """Clean up extracted temporary files."""
     try:
-        import shutil
-        # Remove the temporary directory and all contents
+        # Remove the temporary directory and all contents. The extracted
+        # root is usually one level below the temp dir, but can be the
+        # temp dir itself when the archive has no single top directory.
+        tmp_handle = _extraction_tmpdirs.pop(extracted_path, None) or _extraction_tmpdirs.pop(extracted_path.parent, None)
+        if tmp_handle is not None:
+            tmp_handle.cleanup()
+            default_logger.info(f"Cleaned up temporary extraction: {tmp_handle.name}")
+            return
+        # Extraction not made by this process (or already cleaned up)
         temp_root = extracted_path.parent
-        if 'must_gather_' in temp_root.name:
+        if 'must_gather_' in temp_root.name and temp_root.exists():
             shutil.rmtree(temp_root)
-            logger.info(f"Cleaned up temporary extraction: {temp_root}")
+            default_logger.info(f"Cleaned up temporary extraction: {temp_root}")
     except Exception as e:
-        logger.warning(f"Failed to clean up extraction: {e}")
+        default_logger.warning(f"Failed to clean up extraction: {e}")
 
 if __name__ == "__main__":
     # Test the function with a must-gather path
@@ -1,11 +1,32 @@
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import Iterator, List, Dict, Any, Optional
+import mmap
+import os
 import yaml
 import json
 import structlog
 
+# Prefer the libyaml C loader - same safe-loading semantics, several
+# times faster than the pure-Python SafeLoader
+try:
+    from yaml import CSafeLoader as _Loader
+except ImportError:
+    from yaml import SafeLoader as _Loader
+
 logger = structlog.get_logger(__name__)
 
+# Well-known location of Agent CRs inside a namespace directory; kept as
+# one precomputed segment so the per-namespace join parses it only once
+_AGENTS_SUBPATH = "agent-install.openshift.io/agents"
+
+# API group identifying Agent CRs, hoisted out of the per-document check
+_AGENT_API_GROUP = "agent-install.openshift.io"
+
+# Shared read-only default for .get() chains - avoids allocating a fresh
+# empty dict per lookup in the per-document hot path
+_EMPTY: Dict[str, Any] = {}
+
 class AgentParser:
     def __init__(self, must_gather_path: str = None):
         """
@@ -16,6 +37,17 @@ class AgentParser:
         """
         self.must_gather_path = Path(must_gather_path) if must_gather_path else None
         self.logger = logger
+        # Parsed agents keyed by must-gather path - callers such as
+        # find_agents_belonging_to_cluster re-invoke find_agent_crs, and
+        # without this every call re-walks and re-parses the whole tree
+        self._agents_cache: Dict[Path, List[Dict[str, Any]]] = {}
+        # Inverted index built alongside the cache: agents grouped by
+        # (cluster_deployment_name, cluster_namespace) so per-cluster
+        # lookups don't rescan the full agent list
+        self._cluster_index: Dict[Path, Dict[tuple, List[Dict[str, Any]]]] = {}
+        # Failed agents collected during the same pass - _parse_single_agent
+        # already computed 'failed', so no second full scan is needed
+        self._failed_index: Dict[Path, List[Dict[str, Any]]] = {}
 
     def find_agent_crs(self, must_gather_path: Path = None) -> List[Dict[str, Any]]:
         """
@@ -29,65 +61,100 @@ class AgentParser:
         elif not self.must_gather_path:
             raise ValueError("Must provide must_gather_path either in constructor or method call")
 
+        cached = self._agents_cache.get(self.must_gather_path)
+        if cached is not None:
+            return cached
+
         agents = []
-        
+
         # Look for namespaced Agent CRs
         namespaces_path = self.must_gather_path / "namespaces"
         if namespaces_path.exists():
-            for namespace_dir in namespaces_path.iterdir():
-                if namespace_dir.is_dir():
-                    namespace = namespace_dir.name
-                    # Check for agents in this namespace
-                    agents.extend(self.find_agent_crs_in_directory(namespace_dir))
-        
+            # scandir avoids a stat per entry
+            with os.scandir(namespaces_path) as entries:
+                namespace_dirs = [Path(entry.path) for entry in entries if entry.is_dir(follow_symlinks=False)]
+            # Namespaces are independent, so parse them concurrently; the
+            # work is file reads plus libyaml parsing, both of which
+            # release the GIL. Oversubscribe the cores since much of the
+            # wait is disk I/O, capped so huge hosts don't spawn dozens
+            # of idle threads.
+            max_workers = min(32, (os.cpu_count() or 1) * 4)
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                for ns_agents in executor.map(self._collect_agent_crs_in_directory, namespace_dirs):
+                    agents.extend(ns_agents)
+
         self.logger.info(f"Found {len(agents)} Agent CRs")
+        self._agents_cache[self.must_gather_path] = agents
+        by_cluster: Dict[tuple, List[Dict[str, Any]]] = {}
+        failed_agents: List[Dict[str, Any]] = []
+        for agent in agents:
+            key = (agent['cluster_deployment_name'], agent['cluster_namespace'])
+            by_cluster.setdefault(key, []).append(agent)
+            if agent['failed']:
+                failed_agents.append(agent)
+        self._cluster_index[self.must_gather_path] = by_cluster
+        self._failed_index[self.must_gather_path] = failed_agents
         return agents
     
-    def find_agent_crs_in_directory(self, directory: Path) -> List[Dict[str, Any]]:
-        agents = []
-        ns_agents_path = directory / "agent-install.openshift.io" / "agents"
-        if ns_agents_path.exists():
-            agents.extend(self._parse_agent_files(ns_agents_path))
-        return agents
+    def find_agent_crs_in_directory(self, directory: Path) -> Iterator[Dict[str, Any]]:
+        ns_agents_path = directory / _AGENTS_SUBPATH
+        if os.path.isdir(ns_agents_path):
+            yield from self._parse_agent_files(ns_agents_path)
+
+    def _collect_agent_crs_in_directory(self, directory: Path) -> List[Dict[str, Any]]:
+        """List-materializing wrapper so pool workers do the parsing, not the consumer."""
+        return list(self.find_agent_crs_in_directory(directory))
 
     def find_agents_belonging_to_cluster(self, cluster_name: str, cluster_namespace: str) -> List[Dict[str, Any]]:
         """Find agents belonging to a cluster."""
-        agents = []
-        for agent in self.find_agent_crs():
-            if agent['cluster_deployment_name'] == cluster_name and agent['cluster_namespace'] == cluster_namespace:
-                agents.append(agent)
-        return agents
+        self.find_agent_crs()  # ensures the cluster index is built
+        by_cluster = self._cluster_index.get(self.must_gather_path, {})
+        return list(by_cluster.get((cluster_name, cluster_namespace), []))
 
-    def _parse_agent_files(self, agents_dir: Path, namespace: str = None) -> List[Dict[str, Any]]:
-        """Parse individual Agent CR files in a directory."""
-        agents = []
-        
-        for agent_file in agents_dir.iterdir():
-            if agent_file.is_file() and agent_file.suffix in ['.yaml', '.yml']:
-                agents.extend(self._parse_agent_yaml_file(agent_file, namespace))
-        
-        return agents
+    def _parse_agent_files(self, agents_dir: Path, namespace: str = None) -> Iterator[Dict[str, Any]]:
+        """Parse individual Agent CR files in a directory, yielding agents as they are found."""
+        with os.scandir(agents_dir) as entries:
+            for entry in entries:
+                if entry.is_file(follow_symlinks=False) and entry.name.endswith(('.yaml', '.yml')):
+                    yield from self._parse_agent_yaml_file(Path(entry.path), namespace)
 
     def _parse_agent_yaml_file(self, file_path: Path, namespace: str = None) -> List[Dict[str, Any]]:
         """Parse a YAML file containing Agent CRs."""
         agents = []
         
         try:
-            with open(file_path, 'r') as f:
-                content = f.read()
-                
-            # Parse YAML documents (may contain multiple agents)
-            documents = list(yaml.safe_load_all(content))
-            
-            for doc in documents:
-                if doc and isinstance(doc, dict):
-                    # Check if this is an Agent CR
-                    if (doc.get('kind') == 'Agent' and 
-                        doc.get('apiVersion', '').startswith('agent-install.openshift.io')):
-                        
-                        agent = self._parse_single_agent(doc, namespace)
-                        if agent:
-                            agents.append(agent)
+            # Memory-map the file: the kind prefilter scans the mapped
+            # pages and libyaml reads them on demand, so the file is
+            # never copied into a Python bytes object (mmap rejects
+            # empty files, which have nothing to parse anyway)
+            with open(file_path, 'rb') as f:
+                if os.fstat(f.fileno()).st_size == 0:
+                    return agents
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    # Byte-level prefilter: a substring scan is orders of
+                    # magnitude cheaper than a YAML parse, so skip files
+                    # that can't possibly contain an Agent CR. Unanchored
+                    # on purpose - CRLF or EOF-terminated lines must not
+                    # slip past; the doc-level kind check below handles
+                    # false positives like AgentServiceConfig. (mmap needs
+                    # find() here - 'in' does element checks, not substring)
+                    if mm.find(b'kind: Agent') < 0:
+                        return agents
+
+                    # Parse YAML documents lazily (may contain multiple
+                    # agents); no need to materialize every document up
+                    # front
+                    parse_single = self._parse_single_agent
+                    append_agent = agents.append
+                    for doc in yaml.load_all(mm, Loader=_Loader):
+                        if doc and isinstance(doc, dict):
+                            # Check if this is an Agent CR
+                            if (doc.get('kind') == 'Agent' and
+                                doc.get('apiVersion', '').startswith(_AGENT_API_GROUP)):
+
+                                agent = parse_single(doc, namespace)
+                                if agent:
+                                    append_agent(agent)
                             
         except Exception as e:
             self.logger.warning(f"Failed to parse {file_path}: {e}")
@@ -97,50 +164,53 @@ class AgentParser:
     def _parse_single_agent(self, agent_doc: Dict[str, Any], namespace: str = None) -> Optional[Dict[str, Any]]:
         """Parse a single Agent CR document."""
         try:
-            metadata = agent_doc.get('metadata', {})
-            spec = agent_doc.get('spec', {})
-            status = agent_doc.get('status', {})
+            metadata = agent_doc.get('metadata', _EMPTY)
+            spec = agent_doc.get('spec', _EMPTY)
+            status = agent_doc.get('status', _EMPTY)
             conditions = status.get('conditions', [])
+            # Some CRD versions carry clusterDeploymentName as a plain
+            # string; an isinstance check keeps those documents from
+            # dying in the broad except below and being silently dropped
+            cluster_ref = spec.get('clusterDeploymentName')
+            if not isinstance(cluster_ref, dict):
+                cluster_ref = _EMPTY
             failed = False
             reason = None
+            # Only the Installed condition matters here; check its type
+            # first so the other gets are skipped for non-matching
+            # entries, and stop scanning once it has been found
             for condition in conditions:
-                if condition.get('type') == 'Installed' and condition.get('status') == 'False' and condition.get('reason') == 'InstallationFailed':
-                    failed = True
-                    reason = condition.get('message')
+                if condition.get('type') == 'Installed':
+                    if condition.get('status') == 'False' and condition.get('reason') == 'InstallationFailed':
+                        failed = True
+                        reason = condition.get('message')
+                    break
 
+            # Keep only the fields downstream analysis actually reads -
+            # carrying spec/status/inventory/raw wholesale multiplies the
+            # memory per agent several times over
             agent = {
                 'name': metadata.get('name', 'unknown'),
                 'namespace': namespace or metadata.get('namespace'),
                 'creation_timestamp': metadata.get('creationTimestamp'),
-                #'labels': metadata.get('labels', {}),
-                #'annotations': metadata.get('annotations', {}),
-                #'api_version': agent_doc.get('apiVersion'),
                 'type': 'agent',
-                #'spec': spec,
-                #'status': status,
-                
+
                 # Extract key information for easier analysis
-                'cluster_deployment_name': spec.get('clusterDeploymentName',{}).get('name'),
-                'cluster_namespace': spec.get('clusterDeploymentName',{}).get('namespace'),
+                'cluster_deployment_name': cluster_ref.get('name'),
+                'cluster_namespace': cluster_ref.get('namespace'),
                 'approved': spec.get('approved', False),
                 'hostname': spec.get('hostname'),
                 'role': spec.get('role'),
-                #'installation_disk_path': spec.get('installationDiskPath'),
-                
+
                 # Status information
                 'conditions': conditions,
-                'debug_info': status.get('debugInfo', {}),
-                #'inventory': status.get('inventory', {}),
-                'progress': status.get('progress', {}),
-                'validation_info': status.get('validationInfo', {}),
-                #'installation_disk_id': status.get('installationDiskID'),
-                #'node_name': status.get('nodeName'),
+                'debug_info': status.get('debugInfo', _EMPTY),
+                'progress': status.get('progress', _EMPTY),
+                'validation_info': status.get('validationInfo', _EMPTY),
                 'failed': failed,
                 'reason': reason,
-                # Raw document for detailed analysis
-                #'raw': agent_doc
             }
-            
+
             return agent
             
         except Exception as e:
@@ -149,11 +219,7 @@ class AgentParser:
 
     def get_failed_agents(self, agents: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Get a list of agents that have failed installation."""
-        failed_agents = []
-        for agent in agents:
-            if agent['failed']:
-                failed_agents.append(agent)
-        return failed_agents
+        return [agent for agent in agents if agent['failed']]
 
     def find_failed_agents(self, must_gather_path: str = None) -> List[Dict[str, Any]]:
         """Find and return a list of failed agents from the must-gather."""
@@ -162,8 +228,8 @@ class AgentParser:
         elif not self.must_gather_path:
             raise ValueError("Must provide must_gather_path either in constructor or method call")
 
-        agents = self.find_agent_crs()
-        failed_agents = self.get_failed_agents(agents)
+        self.find_agent_crs()  # ensures the failed index is built
+        failed_agents = list(self._failed_index.get(self.must_gather_path, ()))
         self.logger.info(f"Found {len(failed_agents)} failed agents")
         for agent in failed_agents:
             self.logger.info(f"Agent {agent['name']} in namespace {agent['namespace']} has failed installation. Cluster deployment name: {agent['cluster_deployment_name']}. Reason: {agent['reason']}")
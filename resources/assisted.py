@@ -1,9 +1,17 @@
+from functools import lru_cache
 from pathlib import Path
+import os
+
+
+@lru_cache(maxsize=128)
+def _active(must_gather_path: str) -> bool:
+    # os.path.isdir is a single C-level stat, and the joined path is
+    # built once per cached entry instead of once per call
+    return os.path.isdir(os.path.join(must_gather_path, "cluster-scoped-resources", "agent-install.openshift.io", "agentserviceconfigs"))
 
 
 def assisted_service_active(must_gather_path: Path) -> bool:
     """
     Check if assisted-service is active in the cluster.
     """
-    cluster_agents_path = must_gather_path / "cluster-scoped-resources" / "agent-install.openshift.io" / "agentserviceconfigs"
-    return cluster_agents_path.exists()
\ No newline at end of file
+    return _active(str(must_gather_path))
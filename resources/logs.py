@@ -1,13 +1,96 @@
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
 from pathlib import Path
 from typing import List, Dict, Any, Optional
+import os
 import structlog
-import json
 import re
-from datetime import datetime
 from resources.tools import sanitize_data
 
 logger = structlog.get_logger(__name__)
 
+# Compiled once at import time - _parse_log_line runs for every line of
+# every log file, so per-call re.compile/cache lookups add up fast.
+# Timestamp (ISO and common datetime formats) and level are fused into
+# one alternation so a single finditer pass over the line finds both.
+_LINE_PATTERN = re.compile(
+    r'(?P<timestamp>\d{4}-\d{2}-\d{2}[T ]\d{2}:\d{2}:\d{2}(?:\.\d+)?(?:Z|[+-]\d{2}:?\d{2})?)'
+    r'|(?P<level>\b(?:ERROR|WARN(?:ING)?|INFO|DEBUG|TRACE|FATAL)\b)',
+    re.IGNORECASE,
+)
+
+
+def _parse_log_file(log_file: Path, cluster_name: str = None) -> List[Dict[str, Any]]:
+    """Parse a single log file and extract log entries.
+
+    Module-level (not a method) so it pickles cleanly into process pool
+    workers.
+    """
+    try:
+        # Iterate the file object directly: lines are decoded from the
+        # read buffer as they are consumed, instead of materializing
+        # the whole file as one string plus a list of line copies
+        log_entries = []
+        # Local bindings for the per-line loop
+        parse_line = _parse_log_line
+        sanitize = sanitize_data
+        append_entry = log_entries.append
+        with open(log_file, 'r') as f:
+            for line_number, line in enumerate(f, 1):
+                # Cheap substring check on the raw line first - most lines
+                # don't mention the cluster, and this skips the regex parse
+                # and sanitization passes for all of them
+                if cluster_name not in line:
+                    continue
+                entry = parse_line(line.rstrip('\n'), line_number)
+                if entry and entry['level'] == 'ERROR':
+                    # Sanitize only the lines that survived filtering
+                    entry['message'] = sanitize(entry['message'])
+                    entry.update({
+                        #'namespace': namespace,
+                        #'pod_name': pod_name,
+                        #'container_name': container_name,
+                        #'is_previous': is_previous,
+                        'file_path': log_file,
+                        #'type': 'log',
+                    })
+                    append_entry(entry)
+
+        return log_entries
+
+    except Exception as e:
+        logger.warning(f"Failed to parse log file {log_file}: {e}")
+        return []
+
+
+def _parse_log_line(line: str, line_number: int) -> Optional[Dict[str, Any]]:
+    """
+    Parse a single log line.
+    Attempts to extract timestamp and log level if present.
+    """
+    try:
+        timestamp = None
+        log_level = None
+        for match in _LINE_PATTERN.finditer(line):
+            if match.lastgroup == 'timestamp':
+                if timestamp is None:
+                    timestamp = match.group()
+            elif log_level is None:
+                log_level = match.group().upper()
+            if timestamp is not None and log_level is not None:
+                break
+        return {
+            'timestamp': timestamp,
+            'level': log_level,
+            'message': line,
+            'line_number': line_number,
+        }
+
+    except Exception as e:
+        logger.warning(f"Failed to parse log line: {e}")
+        return None
+
+
 class LogParser:
     def __init__(self, must_gather_path: str = None):
         """
@@ -18,6 +101,10 @@ class LogParser:
         """
         self.must_gather_path = Path(must_gather_path) if must_gather_path else None
         self.logger = logger
+        # Pod directories keyed by must-gather path, built lazily on the
+        # first lookup - without this every find_pod_logs/find_pod_directory
+        # call repeats the glob sweep over namespaces/*/pods/*
+        self._pod_dirs_cache: Dict[Path, List[tuple]] = {}
 
     def find_pod_logs(self, must_gather_path: Path = None, pod_name: str = None, namespace: str = None, cluster_name: str = None) -> List[Dict[str, Any]]:
         """
@@ -32,131 +119,84 @@ class LogParser:
         elif not self.must_gather_path:
             raise ValueError("Must provide must_gather_path either in constructor or method call")
 
+        # Discovery stays a generator pipeline; materialize once here at
+        # the dispatch boundary, where the file count sizes the pool.
+        # Line parsing is regex-heavy pure Python, so the GIL makes
+        # threads useless; a process pool spreads the files across cores.
+        log_files = list(self._iter_log_files(pod_name=pod_name, namespace=namespace))
+
         logs = []
-        
-        # Look for pod logs
-        namespaces_path = self.must_gather_path / "namespaces"
-        if namespaces_path.exists():
-            for namespace_dir in namespaces_path.iterdir():
-                if namespace_dir.is_dir() and (namespace is None or namespace_dir.name.startswith(namespace)):
-                    namespace = namespace_dir.name
-                    # Check for pods in this namespace
-                    pods_path = namespace_dir / "pods"
-                    self.logger.info(f"Checking pods in namespace: {pods_path}")
-                    if pods_path.exists():
-                        for pod_dir in pods_path.iterdir():
-                            if pod_dir.is_dir() and (pod_name is None or pod_dir.name.startswith(pod_name)):
-                                pod_logs_dir = self.find_pod_logs_directory(pod_dir)
-                                if pod_logs_dir:
-                                    self.logger.info(f"Parsing logs for pod {pod_dir.name} in namespace {namespace} using logs directory {pod_logs_dir}")
-                                    logs.extend(self._parse_pod_logs(pod_logs_dir, namespace, pod_dir.name, is_previous=False, cluster_name=cluster_name))
-        
+        if len(log_files) > 2:
+            max_workers = min(len(log_files), os.cpu_count() or 1)
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                for entries in executor.map(_parse_log_file, log_files, repeat(cluster_name), chunksize=4):
+                    logs.extend(entries)
+        else:
+            # Not worth forking a pool for a couple of files
+            for log_file in log_files:
+                logs.extend(_parse_log_file(log_file, cluster_name))
+
         self.logger.info(f"Found {len(logs)} pod log entries")
         return logs
 
+    def _iter_pod_dirs(self, pod_name: str = None, namespace: str = None):
+        """Yield (namespace, pod_dir) for every pod directory matching the optional prefixes."""
+        # One glob sweep finds every pod directory; the result is cached
+        # per must-gather path so repeated lookups only filter the
+        # in-memory list instead of re-walking the tree
+        pod_dirs = self._pod_dirs_cache.get(self.must_gather_path)
+        if pod_dirs is None:
+            pod_dirs = [
+                (pod_dir.parent.parent.name, pod_dir)
+                for pod_dir in self.must_gather_path.glob("namespaces/*/pods/*")
+                if pod_dir.is_dir()
+            ]
+            self._pod_dirs_cache[self.must_gather_path] = pod_dirs
+        for ns_name, pod_dir in pod_dirs:
+            if namespace is not None and not ns_name.startswith(namespace):
+                continue
+            if pod_name is not None and not pod_dir.name.startswith(pod_name):
+                continue
+            yield ns_name, pod_dir
+
+    def _iter_log_files(self, pod_name: str = None, namespace: str = None):
+        """Yield every log file for the pods matching the optional prefixes."""
+        for ns_name, pod_dir in self._iter_pod_dirs(pod_name=pod_name, namespace=namespace):
+            pod_logs_dir = self.find_pod_logs_directory(pod_dir)
+            if pod_logs_dir:
+                # debug: fires once per pod, which is thousands of times
+                # on a real must-gather
+                self.logger.debug(f"Parsing logs for pod {pod_dir.name} in namespace {ns_name} using logs directory {pod_logs_dir}")
+                with os.scandir(pod_logs_dir) as entries:
+                    for entry in entries:
+                        if entry.is_file(follow_symlinks=False):
+                            yield Path(entry.path)
+
     def find_pod_directory(self, pod_name: str = '', namespace: str = '') -> Path:
         """Find the pod directory in the must-gather."""
-        # Look for pod logs
-        namespaces_path = self.must_gather_path / "namespaces"
-        if namespaces_path.exists():
-            for namespace_dir in namespaces_path.iterdir():
-                if namespace_dir.is_dir() and (namespace is None or namespace_dir.name.startswith(namespace)):
-                    namespace = namespace_dir.name
-                    # Check for pods in this namespace
-                    pods_path = namespace_dir / "pods"
-                    self.logger.info(f"Checking pods in namespace: {pods_path}")
-                    if pods_path.exists():
-                        for pod_dir in pods_path.iterdir():
-                            if pod_dir.is_dir() and (pod_name is None or pod_dir.name.startswith(pod_name)):
-                                return pod_dir
+        for _, pod_dir in self._iter_pod_dirs(pod_name=pod_name, namespace=namespace):
+            return pod_dir
         return None
 
     def find_pod_logs_directory(self, pod_dir: Path) -> Path:
-        """Recursively goes down directory tree to find the logs directory for a pod."""
-        if pod_dir.is_dir() and pod_dir.name == 'logs':
-            return pod_dir
+        """Goes down the directory tree to find the logs directory for a pod."""
         if not pod_dir.is_dir():
             return None
-        for pdir in pod_dir.iterdir():
-            return self.find_pod_logs_directory(pdir)
+        if pod_dir.name == 'logs':
+            return pod_dir
+        # Iterative walk with an explicit stack; the previous recursion
+        # descended only into the first child of each directory, so a
+        # 'logs' directory behind any sibling was never found
+        stack = [str(pod_dir)]
+        while stack:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name == 'logs':
+                            return Path(entry.path)
+                        stack.append(entry.path)
         return None
 
-    def _parse_pod_logs(self, logs_path: Path, namespace: str, pod_name: str, is_previous: bool, cluster_name: str = None) -> List[Dict[str, Any]]:
-        """Parse log files for a specific pod."""
-        logs = []
-        
-        for log_file in logs_path.iterdir():
-            if log_file.is_file():
-                container_name = log_file.name
-                log_entries = self._parse_log_file(log_file, namespace, pod_name, container_name, is_previous, cluster_name)
-                if log_entries:
-                    logs.extend(log_entries)
-        
-        return logs
-
-    def _parse_log_file(self, log_file: Path, namespace: str, pod_name: str, container_name: str, is_previous: bool, cluster_name: str = None) -> List[Dict[str, Any]]:
-        """Parse a single log file and extract log entries."""
-        try:
-            with open(log_file, 'r') as f:
-                content = f.read()
-
-            # Split content into lines and parse each line
-            log_entries = []
-            for line_number, line in enumerate(content.splitlines(), 1):
-                entry = self._parse_log_line(line, line_number)
-                if entry and entry['level'] == 'ERROR' and cluster_name in entry['message']:
-                    entry.update({
-                        #'namespace': namespace,
-                        #'pod_name': pod_name,
-                        #'container_name': container_name,
-                        #'is_previous': is_previous,
-                        'file_path': log_file,
-                        #'type': 'log',
-                    })
-                    log_entries.append(entry)
-
-            return log_entries
-                            
-        except Exception as e:
-            self.logger.warning(f"Failed to parse log file {log_file}: {e}")
-            return []
-
-    def _parse_log_line(self, line: str, line_number: int) -> Optional[Dict[str, Any]]:
-        """
-        Parse a single log line. Sanitizes the line before returning.
-        Attempts to extract timestamp and log level if present.
-        """
-        try:
-            # Common timestamp patterns
-            timestamp_patterns = [
-                r'(\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}(?:\.\d+)?(?:Z|[+-]\d{2}:?\d{2})?)',  # ISO format
-                r'(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}(?:\.\d+)?)',  # Common datetime format
-            ]
-            
-            # Common log level patterns
-            level_pattern = r'\b(ERROR|WARN(?:ING)?|INFO|DEBUG|TRACE|FATAL)\b'
-            
-            timestamp = None
-            for pattern in timestamp_patterns:
-                match = re.search(pattern, line)
-                if match:
-                    timestamp = match.group(1)
-                    break
-
-            level_match = re.search(level_pattern, line, re.IGNORECASE)
-            log_level = level_match.group(1).upper() if level_match else None
-            return {
-                'timestamp': timestamp,
-                'level': log_level,
-                'message': sanitize_data(line),
-                'line_number': line_number,
-            }
-            
-        except Exception as e:
-            self.logger.warning(f"Failed to parse log line: {e}")
-            return None
-
-
     def get_logs_by_pod(self, pod_name: str = "assisted-service", must_gather_path: str = None, namespace: str = None, cluster_name: str = None) -> List[Dict[str, Any]]:
         """Get all logs for a specific pod."""
         if must_gather_path: